@@ -29,7 +29,6 @@ def time_full_redraw(csv_path: Path, iterations: int) -> float:
         app.page_redraw_needed = True
         app.cursor_row = 0
         app.cursor_col = 0
-        app.cursor_direction = "R"
         start = time.perf_counter()
         app._refresh_rows()
         total += time.perf_counter() - start
@@ -44,7 +43,6 @@ def time_fast_path(csv_path: Path, iterations: int) -> float:
     total = 0.0
     for i in range(iterations):
         app.page_redraw_needed = False
-        app.cursor_direction = "R" if i % 2 == 0 else "L"
         app.cursor_col = 1 if i % 2 == 0 else 0
         app.cursor_row = 0
         start = time.perf_counter()
@@ -7,7 +7,10 @@ from __future__ import annotations
 
 import csv
 import re
-from copy import deepcopy
+from bisect import bisect_left
+from copy import copy
+from functools import lru_cache
+from io import StringIO
 from pathlib import Path
 from typing import Sequence
 
@@ -15,7 +18,7 @@ import pyperclip
 import urwid
 
 from csvpeek.duck import DuckBackend
-from csvpeek.filters import build_where_clause
+from csvpeek.filters import parse_filters, where_clause_for
 from csvpeek.selection_utils import Selection
 from csvpeek.ui import (
     ConfirmDialog,
@@ -31,11 +34,97 @@ from csvpeek.ui import (
     visible_column_names,
 )
 
+# (pattern, is_regex); regex patterns may be precompiled
+FilterInfo = tuple[str | re.Pattern[str], bool]
+# (col_idx, width, filter_info, attr) for one visible column
+ColumnSpec = tuple[int, int, FilterInfo | None, str | None]
+
+
+@lru_cache(maxsize=4096)
+def _highlight_markup(
+    cell_str: str,
+    width: int,
+    filter_info: FilterInfo | None,
+    is_selected: bool,
+) -> str | tuple:
+    """Markup for a selected or filtered cell; segment lists come back as tuples.
+
+    Memoized: low-cardinality columns repeat the same few values, and the
+    key includes the filter, so a new filter never sees stale spans.
+    """
+    truncated = _truncate(cell_str, width)
+
+    # Use a space for empty cells when selected so the background color shows
+    if not truncated and is_selected:
+        truncated = " "
+
+    if not filter_info:
+        if is_selected:
+            return (("cell_selected", truncated),)
+        return truncated
+
+    pattern, is_regex = filter_info
+    matches = []
+    if is_regex:
+        try:
+            if isinstance(pattern, str):
+                pattern = re.compile(pattern, re.IGNORECASE)
+            for m in pattern.finditer(truncated):
+                matches.append((m.start(), m.end()))
+        except re.error:
+            matches = []
+    else:
+        # lower() + find() measures ~3x faster than an escaped IGNORECASE regex
+        lower_cell = truncated.lower()
+        lower_filter = pattern.lower()
+        size = len(lower_filter)
+        pos = lower_cell.find(lower_filter) if size else -1
+        while pos != -1:
+            matches.append((pos, pos + size))
+            # Resume after the match; overlapping spans would repeat text
+            pos = lower_cell.find(lower_filter, pos + size)
+
+    if not matches:
+        # Use a space for empty cells when selected so the background color shows
+        display_text = truncated if truncated else " " if is_selected else ""
+        if is_selected:
+            return (("cell_selected", display_text),)
+        return display_text
+
+    segments = []
+    last = 0
+    for start, end in matches:
+        if start > last:
+            slice = truncated[last:start]
+            part = ("cell_selected", slice) if is_selected else slice
+            segments.append(part)
+        slice = truncated[start:end]
+        part = ("cell_selected_filter", slice) if is_selected else ("filter", slice)
+        segments.append(part)
+        last = end
+
+    if last < len(truncated):
+        slice = truncated[last:]
+        part = ("cell_selected", slice) if is_selected else slice
+        segments.append(part)
+
+    return tuple(segments)
+
 
 class CSVViewerApp:
     """Urwid-based CSV viewer with filtering, sorting, and selection."""
 
     PAGE_SIZE = 50
+    CURSOR_KEYS = (
+        "left",
+        "right",
+        "up",
+        "down",
+        "shift left",
+        "shift right",
+        "shift up",
+        "shift down",
+    )
     BASE_PALETTE = [
         ("header", "black", "light gray"),
         ("status", "light gray", "dark gray"),
@@ -62,7 +151,10 @@ class CSVViewerApp:
         self.csv_path = Path(csv_path)
         self.db: DuckBackend | None = None
         self.cached_rows: list[tuple] = []
+        self._page_key: tuple | None = None
+        self._rendered_vis_indices: list[int] = []
         self.column_names: list[str] = []
+        self.column_index: dict[str, int] = {}
 
         self.current_page = 0
         self.total_rows = 0
@@ -70,11 +162,15 @@ class CSVViewerApp:
 
         self.current_filters: dict[str, str] = {}
         self.filter_patterns: dict[str, tuple[str, bool]] = {}
+        # filter_patterns with regexes compiled, consumed by the render paths
+        self._active_filter_patterns: dict[str, FilterInfo] = {}
         self.filter_where: str = ""
         self.filter_params: list = []
         self.sorted_column: str | None = None
         self.sorted_descending = False
         self.column_widths: dict[str, int] = {}
+        # width_prefix[i]: screen columns taken by columns 0..i-1, each + divider
+        self.width_prefix: list[int] = [0]
         self.col_offset = 0  # horizontal scroll offset (column index)
         self.row_offset = 0  # vertical scroll offset (row index)
         self.color_columns = color_columns or bool(column_colors)
@@ -95,11 +191,18 @@ class CSVViewerApp:
         self.loop: urwid.MainLoop | None = None
         self.table_walker = urwid.SimpleFocusListWalker([])
         self.table_header = urwid.Columns([])
+        # Pile holding header, divider and rows; set by build_ui
+        self.table_body: urwid.Pile | None = None
+        self._header_key: tuple | None = None
         self.listbox = PagingListBox(self, self.table_walker)
         self.status_widget = urwid.Text("")
         self.overlaying = False
         self.page_redraw_needed = True
-        self.cursor_direction = ""
+        # Absolute (row, col) of the cursor as last painted
+        self._rendered_cursor: tuple[int, int] | None = None
+        self._refresh_pending = False
+        # Terminal (cols, rows), read once and dropped on "window resize"
+        self._screen_size: tuple[int, int] | None = None
 
     # ------------------------------------------------------------------
     # Data loading and preparation
@@ -112,10 +215,15 @@ class CSVViewerApp:
             self.db = DuckBackend(self.csv_path)
             self.db.load()
             self.column_names = list(self.db.column_names)
+            self.column_index = {name: i for i, name in enumerate(self.column_names)}
             self.total_columns = len(self.column_names)
             self.total_rows = self.db.total_rows
             self.total_filtered_rows = self.total_rows
             self.column_widths = self.db.column_widths()
+            self.width_prefix = [0]
+            for name in self.column_names:
+                width = self.column_widths.get(name, 12)
+                self.width_prefix.append(self.width_prefix[-1] + width + 1)
             self.selection.clear()
         except Exception as exc:  # noqa: BLE001
             raise SystemExit(f"Error loading CSV: {exc}") from exc
@@ -171,8 +279,6 @@ class CSVViewerApp:
     def _refresh_rows(self) -> None:
         if not self.db:
             return
-        if not self.selection.active:
-            self.cached_rows = []
         page_size = self.available_body_rows()
 
         # Clamp row_offset to valid range
@@ -180,71 +286,117 @@ class CSVViewerApp:
             0, min(self.row_offset, max(0, self.total_filtered_rows - page_size))
         )
 
-        # Fetch rows directly from database
-        self.cached_rows = self.db.fetch_rows(
+        max_width = current_screen_width(self)
+        self.cursor_col = min(self.cursor_col, max(0, len(self.column_names) - 1))
+        visible_cols = visible_column_names(self, max_width)
+        vis_indices = [self.column_index[c] for c in visible_cols]
+
+        # Only hit the database when the visible page actually changes
+        page_key = (
             self.filter_where,
-            list(self.filter_params),
+            tuple(self.filter_params),
             self.sorted_column,
             self.sorted_descending,
             page_size,
+            tuple(visible_cols),
             self.row_offset,
         )
+        shift = self._page_shift(page_key, page_size)
+        if shift:
+            # Scrolled by one row: fetch only the row that came into view
+            edge = self.row_offset + page_size - 1 if shift > 0 else self.row_offset
+            new_row = self.db.fetch_rows(
+                self.filter_where,
+                list(self.filter_params),
+                self.sorted_column,
+                self.sorted_descending,
+                1,
+                edge,
+                columns=visible_cols,
+                cache=False,
+            )
+            if shift > 0:
+                self.cached_rows = self.cached_rows[1:] + new_row
+            else:
+                self.cached_rows = new_row + self.cached_rows[:-1]
+            self._page_key = page_key
+        elif page_key != self._page_key or not self.cached_rows:
+            self.cached_rows = self.db.fetch_rows(
+                self.filter_where,
+                list(self.filter_params),
+                self.sorted_column,
+                self.sorted_descending,
+                page_size,
+                self.row_offset,
+                columns=visible_cols,
+            )
+            self._page_key = page_key
 
-        max_width = current_screen_width(self)
         # Clamp cursor within available data
         self.cursor_row = min(self.cursor_row, max(0, len(self.cached_rows) - 1))
-        self.cursor_col = min(self.cursor_col, max(0, len(self.column_names) - 1))
 
-        visible_cols = visible_column_names(self, max_width)
-        vis_indices = [self.column_names.index(c) for c in visible_cols]
+        if shift and vis_indices == self._rendered_vis_indices:
+            # Every other row widget is still valid; the cursor and selection
+            # changes are repainted by the diff path below.
+            self._shift_row_widgets(shift, vis_indices)
+            self.page_redraw_needed = False
 
         if self.page_redraw_needed:
-            self.table_walker.clear()
-            for row_idx, row in enumerate(self.cached_rows):
-                row_widget = self._build_row_widget(row_idx, row, vis_indices)
-                self.table_walker.append(row_widget)
-            self.table_header = build_header_row(self, max_width)
+            specs = self._column_specs(vis_indices)
+            row_mask, col_mask = self._selection_masks(len(self.cached_rows))
+            no_cols = [False] * len(self.column_names)
+            rows = [
+                self._build_row_widget(
+                    row_idx, row, specs, col_mask if row_mask[row_idx] else no_cols
+                )
+                for row_idx, row in enumerate(self.cached_rows)
+            ]
+            # Swap the page in with a single walker modification
+            self.table_walker[:] = rows
+            if rows:
+                self.table_walker.set_focus(0)
+            header_key = (
+                tuple(visible_cols),
+                self.sorted_column,
+                self.sorted_descending,
+            )
+            # Page flips keep the same columns; only rebuild when labels change
+            if header_key != self._header_key:
+                self.table_header = build_header_row(self, max_width, visible_cols)
+                if self.table_body is not None:
+                    self.table_body.contents[0] = (
+                        self.table_header,
+                        self.table_body.options("pack"),
+                    )
+                self._header_key = header_key
+            self._rendered_vis_indices = vis_indices
         else:
-
-            def vis_index(col_idx: int) -> int | None:
-                try:
-                    return vis_indices.index(col_idx)
-                except ValueError:
-                    return None
+            vis_positions = {col_idx: pos for pos, col_idx in enumerate(vis_indices)}
 
             def refresh_cell(row_idx: int, col_idx: int, *, selected: bool) -> bool:
-                vis_idx = vis_index(col_idx)
+                vis_idx = vis_positions.get(col_idx)
                 if vis_idx is None:
                     return False
                 if not (0 <= row_idx < len(self.cached_rows)):
                     return False
-                row_data = self.cached_rows[row_idx]
-                _width, text = self._build_cell_widget(
-                    row_data,
+                markup = self._build_cell_markup(
+                    self.cached_rows[row_idx],
                     row_idx,
                     col_idx,
                     selected_override=selected,
                 )
-                row_widget = self.table_walker[row_idx]
-                _cur_widget, opts = row_widget.contents[vis_idx]
-                row_widget.contents[vis_idx] = (text, opts)
+                # Retext the existing widget; the row's contents stay untouched
+                cell = self.table_walker[row_idx].contents[vis_idx][0]
+                cell.base_widget.set_text(markup)
                 return True
 
             ok_current = refresh_cell(self.cursor_row, self.cursor_col, selected=True)
 
-            prev_cursor_row = self.cursor_row
-            prev_cursor_col = self.cursor_col
-            if self.cursor_direction == "L":
-                prev_cursor_col += 1
-            elif self.cursor_direction == "R":
-                prev_cursor_col -= 1
-            elif self.cursor_direction == "D":
-                prev_cursor_row -= 1
-            elif self.cursor_direction == "U":
-                prev_cursor_row += 1
-
             ok_prev = True
-            if self.cursor_direction:
+            cursor = (self.row_offset + self.cursor_row, self.cursor_col)
+            if self._rendered_cursor and self._rendered_cursor != cursor:
+                prev_cursor_row = self._rendered_cursor[0] - self.row_offset
+                prev_cursor_col = self._rendered_cursor[1]
                 ok_prev = refresh_cell(
                     prev_cursor_row,
                     prev_cursor_col,
@@ -255,58 +407,170 @@ class CSVViewerApp:
                 self.page_redraw_needed = True
                 return self._refresh_rows()
 
-            for row_idx, col_idx in self.prev_selection.remove(self.selection):
-                refresh_cell(row_idx - self.row_offset, col_idx, selected=False)
-
-            for row_idx, col_idx in self.prev_selection.add(self.selection):
-                refresh_cell(row_idx - self.row_offset, col_idx, selected=True)
-
-        if self.loop:
-            frame_widget = self.loop.widget
-            if isinstance(frame_widget, urwid.Overlay):
-                frame_widget = frame_widget.bottom_w
-            if isinstance(frame_widget, urwid.Frame):
-                frame_widget.body.contents[0] = (
-                    self.table_header,
-                    frame_widget.body.options("pack"),
+            if self.prev_selection.active or self.selection.active:
+                row_offset = self.row_offset
+                cursor_cell = (self.cursor_row, self.cursor_col)
+                # Only on-screen cells are repainted, so a huge selection
+                # costs no more than the page it overlaps.
+                on_screen = (
+                    row_offset,
+                    row_offset + len(self.cached_rows) - 1,
+                    min(vis_indices, default=0),
+                    max(vis_indices, default=-1),
                 )
+                for abs_row, col_idx in self.prev_selection.remove(
+                    self.selection, on_screen
+                ):
+                    row_idx = abs_row - row_offset
+                    # Removed cells lie outside the new selection, so only the
+                    # cursor can still be highlighted; no bounds check needed.
+                    selected = (row_idx, col_idx) == cursor_cell
+                    refresh_cell(row_idx, col_idx, selected=selected)
+
+                for abs_row, col_idx in self.prev_selection.add(
+                    self.selection, on_screen
+                ):
+                    refresh_cell(abs_row - row_offset, col_idx, selected=True)
+
         self._update_status()
         self.page_redraw_needed = False
+        # The next diff repaint starts from what is on screen now
+        self._rendered_cursor = (self.row_offset + self.cursor_row, self.cursor_col)
+        self.prev_selection = copy(self.selection)
+
+    def _schedule_refresh(self) -> None:
+        """Refresh rows once the pending burst of key presses is handled.
+
+        The zero-delay alarm fires only after urwid has processed all input
+        that is already waiting, so a held key repaints once per batch.
+        """
+        if self.loop is None:
+            self._refresh_rows()
+            return
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.loop.set_alarm_in(0, self._flush_refresh)
+
+    def _flush_refresh(self, *_args) -> None:
+        """Run a scheduled refresh now; the alarm is a no-op if already done."""
+        if not self._refresh_pending:
+            return
+        self._refresh_pending = False
+        self._refresh_rows()
+
+    def _page_shift(self, page_key: tuple, page_size: int) -> int:
+        """Return +1/-1 if ``page_key`` is the cached page scrolled by one row."""
+        if self._page_key is None or len(self.cached_rows) != page_size:
+            return 0
+        if page_key[:-1] != self._page_key[:-1]:
+            return 0
+        shift = page_key[-1] - self._page_key[-1]
+        return shift if shift in (1, -1) else 0
+
+    def _shift_row_widgets(self, shift: int, vis_indices: list[int]) -> None:
+        """Drop the row widget that scrolled out and build the one scrolled in."""
+        row_idx = len(self.cached_rows) - 1 if shift > 0 else 0
+        row_mask, col_mask = self._selection_masks(len(self.cached_rows))
+        if not row_mask[row_idx]:
+            col_mask = [False] * len(self.column_names)
+        row = self._build_row_widget(
+            row_idx,
+            self.cached_rows[row_idx],
+            self._column_specs(vis_indices),
+            col_mask,
+        )
+        rows = list(self.table_walker)
+        rows = rows[1:] + [row] if shift > 0 else [row] + rows[:-1]
+        self.table_walker[:] = rows
+        self.table_walker.set_focus(0)
 
-    def _build_cell_widget(
+    def _build_cell_markup(
         self,
         row: tuple,
         row_idx: int,
         col_idx: int,
         *,
         selected_override: bool | None = None,
-    ) -> tuple[int, urwid.Widget]:
-        col_name = self.column_names[col_idx]
-        width = self.column_widths.get(col_name, 12)
-        cell_val = row[col_idx]
+    ):
+        col_idx, width, filter_info, _attr = self._column_specs([col_idx])[0]
         is_selected = (
             selected_override
             if selected_override is not None
             else self._cell_selected(row_idx, col_idx)
         )
-        filter_info = self.filter_patterns.get(col_name)
-        markup = self._cell_markup(str(cell_val or ""), width, filter_info, is_selected)
+        return self._cell_content(row[col_idx], width, filter_info, is_selected)
+
+    def _column_specs(self, vis_indices: list[int]) -> list[ColumnSpec]:
+        """Per-column render invariants as (col_idx, width, filter_info, attr)."""
+        specs = []
+        for col_idx in vis_indices:
+            col_name = self.column_names[col_idx]
+            specs.append(
+                (
+                    col_idx,
+                    self.column_widths.get(col_name, 12),
+                    self._active_filter_patterns.get(col_name),
+                    self._column_attr(col_idx),
+                )
+            )
+        return specs
+
+    def _make_cell(
+        self,
+        cell_str: str,
+        width: int,
+        filter_info: FilterInfo | None,
+        attr: str | None,
+        is_selected: bool,
+    ) -> urwid.Widget:
+        markup = self._cell_content(cell_str, width, filter_info, is_selected)
         text = urwid.Text(markup, wrap="clip")
-        attr = self._column_attr(col_idx)
         if attr:
             text = urwid.AttrMap(text, attr)
-        return width, text
+        return text
+
+    def _cell_content(
+        self,
+        cell_str: str,
+        width: int,
+        filter_info: FilterInfo | None,
+        is_selected: bool,
+    ):
+        if filter_info is None and not is_selected:
+            # Common case: plain text, no highlighting to compute. _truncate is
+            # inlined; this runs for nearly every cell of a full redraw.
+            if len(cell_str) <= width:
+                return cell_str
+            return cell_str[: width - 1] + "…"
+        return self._cell_markup(cell_str, width, filter_info, is_selected)
 
     def _build_row_widget(
-        self, row_idx: int, row: tuple, vis_indices: list[int]
+        self,
+        row_idx: int,
+        row: tuple,
+        specs: list[ColumnSpec],
+        col_mask: list[bool],
     ) -> urwid.Widget:
+        """Build one table row; ``col_mask`` marks selected columns in this row."""
         if not self.column_names:
             return urwid.Text("")
+        make_cell = self._make_cell
+        cursor_col = self.cursor_col if row_idx == self.cursor_row else -1
         cells = []
-        for col_idx in vis_indices:
-            width, widget = self._build_cell_widget(row, row_idx, col_idx)
-            cells.append((width, widget))
-        return FlowColumns(cells, dividechars=1)
+        for col_idx, width, filter_info, attr in specs:
+            is_selected = col_mask[col_idx] or col_idx == cursor_col
+            cell = make_cell(row[col_idx], width, filter_info, attr, is_selected)
+            cells.append((width, cell))
+        return FlowColumns.from_cells(cells, dividechars=1)
+
+    def _selection_masks(self, n_rows: int) -> tuple[list[bool], list[bool]]:
+        """Page-relative row and column membership of the current selection."""
+        row_start, row_end, col_start, col_end = self._selection_bounds()
+        rows = range(row_start - self.row_offset, row_end - self.row_offset + 1)
+        cols = range(col_start, col_end + 1)
+        row_mask = [idx in rows for idx in range(n_rows)]
+        col_mask = [idx in cols for idx in range(len(self.column_names))]
+        return row_mask, col_mask
 
     def _cell_selected(self, row_idx: int, col_idx: int) -> bool:
         abs_row = self.row_offset + row_idx
@@ -326,64 +590,12 @@ class CSVViewerApp:
         self,
         cell_str: str,
         width: int,
-        filter_info: tuple[str, bool] | None,
+        filter_info: FilterInfo | None,
         is_selected: bool,
     ):
-        truncated = _truncate(cell_str, width)
-
-        # Use a space for empty cells when selected so the background color shows
-        if not truncated and is_selected:
-            truncated = " "
-
-        if not filter_info:
-            if is_selected:
-                return [("cell_selected", truncated)]
-            return truncated
-
-        pattern, is_regex = filter_info
-        matches = []
-        if is_regex:
-            try:
-                for m in re.finditer(pattern, truncated, re.IGNORECASE):
-                    matches.append((m.start(), m.end()))
-            except re.error:
-                matches = []
-        else:
-            lower_cell = truncated.lower()
-            lower_filter = pattern.lower()
-            start = 0
-            while True:
-                pos = lower_cell.find(lower_filter, start)
-                if pos == -1:
-                    break
-                matches.append((pos, pos + len(lower_filter)))
-                start = pos + 1
-
-        if not matches:
-            # Use a space for empty cells when selected so the background color shows
-            display_text = truncated if truncated else " " if is_selected else ""
-            if is_selected:
-                return [("cell_selected", display_text)]
-            return display_text
-
-        segments = []
-        last = 0
-        for start, end in matches:
-            if start > last:
-                slice = truncated[last:start]
-                part = ("cell_selected", slice) if is_selected else slice
-                segments.append(part)
-            slice = truncated[start:end]
-            part = ("cell_selected_filter", slice) if is_selected else ("filter", slice)
-            segments.append(part)
-            last = end
-
-        if last < len(truncated):
-            slice = truncated[last:]
-            part = ("cell_selected", slice) if is_selected else slice
-            segments.append(part)
-
-        return segments
+        markup = _highlight_markup(cell_str, width, filter_info, is_selected)
+        # Hand out a fresh list; the cached segments are shared
+        return markup if isinstance(markup, str) else list(markup)
 
     # ------------------------------------------------------------------
     # Interaction handlers
@@ -391,6 +603,10 @@ class CSVViewerApp:
     def handle_input(self, key: str) -> None:
         if self.overlaying:
             return
+        if key not in self.CURSOR_KEYS:
+            # Cursor moves from this burst may not be drawn yet; other keys
+            # must act on the page the cursor now points into.
+            self._flush_refresh()
         if key in ("q", "Q"):
             self.confirm_quit()
             return
@@ -418,16 +634,7 @@ class CSVViewerApp:
         if key == "?":
             self.open_help_dialog()
             return
-        if key in (
-            "left",
-            "right",
-            "up",
-            "down",
-            "shift left",
-            "shift right",
-            "shift up",
-            "shift down",
-        ):
+        if key in self.CURSOR_KEYS:
             self.move_cursor(key)
 
     def confirm_quit(self) -> None:
@@ -508,20 +715,23 @@ class CSVViewerApp:
             return
         if filters is not None:
             self.current_filters = filters
-            self.filter_patterns = {}
-            for col, val in filters.items():
-                cleaned = val.strip()
-                if not cleaned:
-                    continue
-                if cleaned.startswith("/") and len(cleaned) > 1:
-                    self.filter_patterns[col] = (cleaned[1:], True)
-                else:
-                    self.filter_patterns[col] = (cleaned, False)
-
-        where, params = build_where_clause(self.current_filters, self.column_names)
+            # Highlight exactly the filters that take part in the WHERE clause
+            self.filter_patterns = parse_filters(filters, self.column_index)
+            self._active_filter_patterns = {
+                col: (
+                    re.compile(pattern, re.IGNORECASE) if is_regex else pattern,
+                    is_regex,
+                )
+                for col, (pattern, is_regex) in self.filter_patterns.items()
+            }
+
+        # filter_patterns is already parsed; don't parse the dict a second time
+        where, params = where_clause_for(self.filter_patterns)
         self.filter_where = where
         self.filter_params = params
-        self.total_filtered_rows = self.db.count_filtered(where, params)
+        self.total_filtered_rows = self.db.count_filtered(
+            where, params, self.sorted_column, self.sorted_descending
+        )
         self.current_page = 0
         self.row_offset = 0
         self.selection.clear()
@@ -532,6 +742,7 @@ class CSVViewerApp:
     def reset_filters(self) -> None:
         self.current_filters = {}
         self.filter_patterns = {}
+        self._active_filter_patterns = {}
         self.sorted_column = None
         self.sorted_descending = False
         self.filter_where = ""
@@ -562,9 +773,8 @@ class CSVViewerApp:
         self.prev_selection = Selection()
         self.cached_rows = []
         self.cursor_row = 0
+        # Sorting only reorders rows; keep the horizontal column layout as is.
         self.cursor_col = min(self.cursor_col, max(0, len(self.column_names) - 1))
-        self.col_offset = 0
-        self.cursor_direction = ""
         self.page_redraw_needed = True
         self._refresh_rows()
         direction = "descending" if self.sorted_descending else "ascending"
@@ -575,10 +785,43 @@ class CSVViewerApp:
     # ------------------------------------------------------------------
     def get_single_cell_value(self) -> str:
         """Return the current cell value as a string."""
-        if not self.cached_rows:
+        if not self.cached_rows or self.cursor_col >= len(self.column_names):
             return ""
-        row = self.cached_rows[self.cursor_row]
-        cell = row[self.cursor_col] if self.cursor_col < len(row) else None
+        col_name = self.column_names[self.cursor_col]
+        key = self._page_key
+        view = (
+            self.filter_where,
+            tuple(self.filter_params),
+            self.sorted_column,
+            self.sorted_descending,
+        )
+        if (
+            key is not None
+            and key[:4] == view
+            and key[-1] == self.row_offset
+            and col_name in key[5]
+            and self.cursor_row < len(self.cached_rows)
+        ):
+            row = self.cached_rows[self.cursor_row]
+        elif self.db:
+            # cached_rows only holds the drawn columns (others are ''), and may
+            # predate the cursor; read the cell itself instead.
+            rows = self.db.fetch_rows(
+                self.filter_where,
+                list(self.filter_params),
+                self.sorted_column,
+                self.sorted_descending,
+                1,
+                self.row_offset + self.cursor_row,
+                columns=[col_name],
+                cache=False,
+            )
+            if not rows:
+                return ""
+            row = rows[0]
+        else:
+            return ""
+        cell = row[self.cursor_col]
         return "" if cell is None else str(cell)
 
     def _selection_bounds(self) -> tuple[int, int, int, int]:
@@ -595,6 +838,8 @@ class CSVViewerApp:
         row_start, row_end, col_start, col_end = self._selection_bounds()
         fetch_count = row_end - row_start + 1
 
+        # Only the selected columns are read and cleaned by DuckDB; a
+        # one-off export must not evict the pages on screen
         rows = self.db.fetch_rows(
             self.filter_where,
             list(self.filter_params),
@@ -602,14 +847,15 @@ class CSVViewerApp:
             self.sorted_descending,
             fetch_count,
             row_start,
+            columns=self.column_names[col_start : col_end + 1],
+            cache=False,
         )
 
         return [row[col_start : col_end + 1] for row in rows]
 
     def clear_selection_and_update(self) -> None:
-        """Clear selection and refresh visuals."""
+        """Clear selection and repaint only the previously selected cells on screen."""
         self.selection.clear()
-        self.page_redraw_needed = True
         self._refresh_rows()
 
     def get_selection_dimensions(
@@ -627,6 +873,7 @@ class CSVViewerApp:
         return row_end - row_start + 1, col_end - col_start + 1
 
     def copy_selection(self) -> None:
+        self._flush_refresh()
         if not self.cached_rows:
             return
         if not self.selection.active:
@@ -639,13 +886,10 @@ class CSVViewerApp:
             self.notify("Cell copied")
             return
         selected_rows = self.create_selected_dataframe()
-        num_rows, num_cols = self.get_selection_dimensions()
-        _row_start, _row_end, col_start, col_end = self.get_selection_dimensions(
-            as_bounds=True
-        )
+        row_start, row_end, col_start, col_end = self._selection_bounds()
+        num_rows, num_cols = row_end - row_start + 1, col_end - col_start + 1
         headers = self.column_names[col_start : col_end + 1]
-        from io import StringIO
-
+        # pyperclip needs one str, so the CSV text is built in memory once
         buffer = StringIO()
         writer = csv.writer(buffer)
         writer.writerow(headers)
@@ -691,6 +935,7 @@ class CSVViewerApp:
         show_overlay(self, dialog)
 
     def _save_to_file(self, file_path: str) -> None:
+        self._flush_refresh()
         if not self.cached_rows:
             self.notify("No data to save")
             return
@@ -703,10 +948,8 @@ class CSVViewerApp:
         if self.selection.active:
             # Save the selection
             selected_rows = self.create_selected_dataframe()
-            num_rows, num_cols = self.get_selection_dimensions()
-            _row_start, _row_end, col_start, col_end = self.get_selection_dimensions(
-                as_bounds=True
-            )
+            row_start, row_end, col_start, col_end = self._selection_bounds()
+            num_rows, num_cols = row_end - row_start + 1, col_end - col_start + 1
             headers = self.column_names[col_start : col_end + 1]
             try:
                 with target.open("w", newline="", encoding="utf-8") as f:
@@ -723,13 +966,11 @@ class CSVViewerApp:
             if not self.db:
                 self.notify("No data to save")
                 return
-            all_filtered_rows = self.db.fetch_rows(
+            all_filtered_rows = self.db.iter_rows(
                 self.filter_where,
                 list(self.filter_params),
                 self.sorted_column,
                 self.sorted_descending,
-                self.total_filtered_rows,
-                0,
             )
             try:
                 with target.open("w", newline="", encoding="utf-8") as f:
@@ -757,49 +998,60 @@ class CSVViewerApp:
     # ------------------------------------------------------------------
     # Layout and sizing helpers
     # ------------------------------------------------------------------
+    def screen_size(self) -> tuple[int, int] | None:
+        """Terminal (cols, rows), or None without a screen.
+
+        get_cols_rows() issues an ioctl, and every key press asks for the size
+        several times; it only changes on resize, see _filter_input.
+        """
+        if not self.loop or not self.loop.screen:
+            return None
+        if self._screen_size is None:
+            self._screen_size = self.loop.screen.get_cols_rows()
+        return self._screen_size
+
+    def _filter_input(self, keys: list, _raw: list) -> list:
+        if "window resize" in keys:
+            self._screen_size = None
+            self.page_redraw_needed = True
+            self._schedule_refresh()
+        return keys
+
     def current_screen_width(self) -> int:
-        if self.loop and self.loop.screen:
-            cols, _rows = self.loop.screen.get_cols_rows()
-            return max(cols, 40)
+        size = self.screen_size()
+        if size:
+            return max(size[0], 40)
         return 80
 
     def available_body_rows(self) -> int:
-        if not self.loop or not self.loop.screen:
+        size = self.screen_size()
+        if not size:
             return self.PAGE_SIZE
-        _cols, rows = self.loop.screen.get_cols_rows()
+        _cols, rows = size
         reserved = 4  # header, divider, footer
         return max(5, rows - reserved)
 
     # ------------------------------------------------------------------
     # Cursor and selection helpers
     # ------------------------------------------------------------------
-    def ensure_cursor_visible(self, max_width: int, widths: list[int]) -> None:
-        if not widths:
+    def ensure_cursor_visible(self, max_width: int) -> None:
+        if not self.column_names:
             return
-        divide = 1
-        col = min(self.cursor_col, len(widths) - 1)
+        prefix = self.width_prefix
+        col = min(self.cursor_col, len(self.column_names) - 1)
         prev_offset = self.col_offset
         if col < self.col_offset:
             self.col_offset = col
         else:
-            for _ in range(len(widths)):
-                total = 0
-                for idx in range(self.col_offset, col + 1):
-                    total += widths[idx]
-                    if idx > self.col_offset:
-                        total += divide
-                if total <= max_width or self.col_offset == col:
-                    break
-                self.col_offset += 1
+            # Smallest offset whose columns up to the cursor fit on screen
+            fits = bisect_left(prefix, prefix[col + 1] - 1 - max_width)
+            self.col_offset = min(max(self.col_offset, fits), col)
         if self.col_offset != prev_offset:
             self.page_redraw_needed = True
 
     def move_cursor(self, key: str) -> None:
         extend = key.startswith("shift")
 
-        # Capture state before mutating selection so diff repaint has the real "before".
-        prev_selection_snapshot = deepcopy(self.selection)
-
         if extend and not self.selection.active:
             self.selection.start(self.row_offset + self.cursor_row, self.cursor_col)
 
@@ -834,31 +1086,15 @@ class CSVViewerApp:
         self.cursor_col = new_cursor_col
         self.row_offset = row_offset
 
-        direction = ""
-        if new_cursor_row == cursor_row:
-            if new_cursor_col < cursor_col:
-                direction = "L"
-            else:
-                direction = "R"
-        elif new_cursor_col == cursor_col:
-            if new_cursor_row > cursor_row:
-                direction = "D"
-            else:
-                direction = "U"
-
-        self.cursor_direction = direction
-
         abs_row = self.row_offset + self.cursor_row
-        self.prev_selection = prev_selection_snapshot
 
         if extend:
             self.selection.extend(abs_row, self.cursor_col)
         else:
             self.selection.clear()
 
-        widths = [self.column_widths.get(c, 12) for c in self.column_names]
-        self.ensure_cursor_visible(self.current_screen_width(), widths)
-        self._refresh_rows()
+        self.ensure_cursor_visible(self.current_screen_width())
+        self._schedule_refresh()
 
     # ------------------------------------------------------------------
     # Status helper
@@ -881,7 +1117,9 @@ class CSVViewerApp:
         col_info = f"Col: {self.cursor_col + 1}/{self.total_columns}"
 
         status = f"{page_info} | {row_info}, {col_info} | {selection_info} | Press ? for help"
-        self.status_widget.set_text(status)
+        # Compare against the widget so a pending notification still gets replaced
+        if self.status_widget.text != status:
+            self.status_widget.set_text(status)
 
     # ------------------------------------------------------------------
     # Main entry
@@ -897,6 +1135,7 @@ class CSVViewerApp:
             screen=screen,
             handle_mouse=False,
             unhandled_input=self.handle_input,
+            input_filter=self._filter_input,
         )
         # Disable mouse reporting so terminal selection works
         self.loop.screen.set_mouse_tracking(False)
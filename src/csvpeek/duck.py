@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from pathlib import Path
+from typing import Collection, Iterator, Sequence
 
 import duckdb
 
@@ -8,28 +10,43 @@ import duckdb
 class DuckBackend:
     """DuckDB-backed data source for csvpeek."""
 
+    # Above this many rows, filtered/sorted results are queried directly
+    # instead of being copied into a result table.
+    MATERIALIZE_MAX_ROWS = 10_000_000
+    # Number of distinct filter sets whose row counts are remembered.
+    COUNT_CACHE_SIZE = 32
+    # Number of recently fetched pages kept for flipping back and forth.
+    PAGE_CACHE_SIZE = 4
+
     def __init__(self, csv_path: Path, table_name: str = "data") -> None:
         self.csv_path = Path(csv_path)
         self.table_name = table_name
+        self.result_table = f"{table_name}_result"
         self.con: duckdb.DuckDBPyConnection | None = None
         self.column_names: list[str] = []
         self.total_rows: int = 0
+        self._result_key: tuple | None = None
+        self._result_rows = 0
+        self._count_cache: OrderedDict[tuple, int] = OrderedDict()
+        self._page_cache: OrderedDict[tuple, list[tuple]] = OrderedDict()
 
     def load(self) -> None:
         """Load the CSV into an in-memory DuckDB table and read schema/row count."""
         self.con = duckdb.connect(database=":memory:")
-        self.con.execute(
+        self._result_key = None
+        self._count_cache.clear()
+        self._page_cache.clear()
+        created = self.con.execute(
             f"""
             CREATE TABLE {self.table_name} AS
             SELECT * FROM read_csv_auto(?, ALL_VARCHAR=TRUE)
             """,
             [str(self.csv_path)],
         )
+        # CREATE TABLE AS reports the inserted row count; no count(*) scan needed
+        self.total_rows = created.fetchone()[0]  # type: ignore
         info = self.con.execute(f"PRAGMA table_info('{self.table_name}')").fetchall()
         self.column_names = [row[1] for row in info]
-        self.total_rows = self.con.execute(
-            f"SELECT count(*) FROM {self.table_name}"
-        ).fetchone()[0]  # type: ignore
 
     def quote_ident(self, name: str) -> str:
         escaped = name.replace('"', '""')
@@ -62,21 +79,90 @@ class DuckBackend:
         direction = "DESC" if sorted_descending else "ASC"
         return f" ORDER BY {self.quote_ident(sorted_column)} {direction}"
 
-    def _select_clause_with_stripped_newlines(self) -> str:
-        """Build a SELECT clause that strips control characters from all columns."""
+    def _select_clause_with_stripped_newlines(
+        self, columns: Collection[str] | None = None
+    ) -> str:
+        """Build a SELECT clause that strips control characters from all columns.
+
+        NULLs are returned as empty strings so callers get plain ``str`` cells.
+        Columns not in ``columns`` (when given) are returned as empty strings
+        without being read, so rows keep their full width.
+        """
         if not self.column_names:
             return "*"
-        selects = [
-            f"regexp_replace({self.quote_ident(col)}, '[\\x00-\\x1f\\x7f-\\x9f]', '', 'g') AS {self.quote_ident(col)}"
-            for col in self.column_names
-        ]
+        selects = []
+        for col in self.column_names:
+            ident = self.quote_ident(col)
+            if columns is not None and col not in columns:
+                selects.append(f"'' AS {ident}")
+            else:
+                selects.append(
+                    f"coalesce(regexp_replace({ident}, '[\\x00-\\x1f\\x7f-\\x9f]', '', 'g'), '') AS {ident}"
+                )
         return ", ".join(selects)
 
-    def count_filtered(self, where: str, params: list) -> int:
+    def _source_table(
+        self,
+        where: str,
+        params: list,
+        sorted_column: str | None,
+        sorted_descending: bool,
+    ) -> tuple[str, str, list]:
+        """Return (table, clauses, params) to page through for the given view.
+
+        Filtered or sorted views are materialized once into a result table so
+        that paging only scans it instead of re-running the filter and sort.
+        """
+        order_clause = self._order_clause(sorted_column, sorted_descending)
+        too_large = self.total_rows > self.MATERIALIZE_MAX_ROWS
+        if not (where or order_clause) or too_large:
+            return self.table_name, f"{where}{order_clause}", params
+
+        key = (where, tuple(params), sorted_column, sorted_descending)
+        if key != self._result_key:
+            created = self.con.execute(  # type: ignore
+                f"CREATE OR REPLACE TEMP TABLE {self.result_table} AS "
+                f"SELECT * FROM {self.table_name}{where}{order_clause}",
+                params,
+            )
+            self._result_key = key
+            self._result_rows = created.fetchone()[0]  # type: ignore
+        return self.result_table, "", []
+
+    def count_filtered(
+        self,
+        where: str,
+        params: list,
+        sorted_column: str | None = None,
+        sorted_descending: bool = False,
+    ) -> int:
+        """Count rows matching ``where``.
+
+        Pass the current sort so the count can come from materializing the
+        view that the first page fetch would build anyway.
+        """
         if not self.con:
             return 0
-        count_query = f"SELECT count(*) FROM {self.table_name}{where}"
-        return self.con.execute(count_query, params).fetchone()[0]  # type: ignore
+        if not where:
+            # Unfiltered count never changes; reuse the value cached at load.
+            return self.total_rows
+        key = (where, tuple(params))
+        cached = self._count_cache.get(key)
+        if cached is not None:
+            self._count_cache.move_to_end(key)
+            return cached
+        table, _clauses, _params = self._source_table(
+            where, params, sorted_column, sorted_descending
+        )
+        if table == self.result_table:
+            count = self._result_rows
+        else:
+            count_query = f"SELECT count(*) FROM {self.table_name}{where}"
+            count = self.con.execute(count_query, params).fetchone()[0]  # type: ignore
+        self._count_cache[key] = count
+        if len(self._count_cache) > self.COUNT_CACHE_SIZE:
+            self._count_cache.popitem(last=False)
+        return count
 
     def fetch_rows(
         self,
@@ -86,10 +172,65 @@ class DuckBackend:
         sorted_descending: bool,
         limit: int,
         offset: int,
+        columns: Sequence[str] | None = None,
+        cache: bool = True,
     ) -> list[tuple]:
+        """Fetch one page of the view; only ``columns`` are read when given.
+
+        Pass ``cache=False`` for one-off reads (single rows or cells) so they
+        don't push whole pages out of the small page cache.
+        """
         if not self.con:
             return []
-        order_clause = self._order_clause(sorted_column, sorted_descending)
+        projection = tuple(columns) if columns is not None else None
+        key = (
+            where,
+            tuple(params),
+            sorted_column,
+            sorted_descending,
+            limit,
+            offset,
+            projection,
+        )
+        cached = self._page_cache.get(key) if cache else None
+        if cached is not None:
+            self._page_cache.move_to_end(key)
+            return list(cached)
+        table, clauses, params = self._source_table(
+            where, params, sorted_column, sorted_descending
+        )
+        select_clause = self._select_clause_with_stripped_newlines(
+            None if projection is None else set(projection)
+        )
+        # Slice first, then strip: the projection only runs on the page rows
+        # instead of on every row the sort/offset has to look at.
+        page = f"SELECT * FROM {table}{clauses} LIMIT ? OFFSET ?"
+        query = f"SELECT {select_clause} FROM ({page})"
+        rows = self.con.execute(query, params + [limit, offset]).fetchall()
+        if not cache:
+            return rows
+        self._page_cache[key] = rows
+        if len(self._page_cache) > self.PAGE_CACHE_SIZE:
+            self._page_cache.popitem(last=False)
+        return list(rows)
+
+    def iter_rows(
+        self,
+        where: str,
+        params: list,
+        sorted_column: str | None,
+        sorted_descending: bool,
+        batch_size: int = 10_000,
+    ) -> Iterator[tuple]:
+        """Yield every row of the filtered/sorted view in fetchmany batches."""
+        if not self.con:
+            return
+        table, clauses, params = self._source_table(
+            where, params, sorted_column, sorted_descending
+        )
         select_clause = self._select_clause_with_stripped_newlines()
-        query = f"SELECT {select_clause} FROM {self.table_name}{where}{order_clause} LIMIT ? OFFSET ?"
-        return self.con.execute(query, params + [limit, offset]).fetchall()
+        result = self.con.execute(
+            f"SELECT {select_clause} FROM {table}{clauses}", params
+        )
+        while batch := result.fetchmany(batch_size):
+            yield from batch
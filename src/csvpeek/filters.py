@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import re
-from typing import Iterable
+from functools import lru_cache
+from typing import AbstractSet, Iterable, Mapping
 
 
 def _quote_ident(name: str) -> str:
@@ -11,18 +12,32 @@ def _quote_ident(name: str) -> str:
     return f'"{repl}"'
 
 
-def build_where_clause(
+@lru_cache(maxsize=256)
+def _is_valid_regex(pattern: str) -> bool:
+    # re caches compiled patterns but not failures, so invalid input would
+    # otherwise be recompiled on every apply.
+    try:
+        re.compile(pattern)
+    except re.error:
+        return False
+    return True
+
+
+def parse_filters(
     filters: dict[str, str], valid_columns: Iterable[str]
-) -> tuple[str, list]:
-    """Build a DuckDB WHERE clause and parameters from filter definitions.
+) -> dict[str, tuple[str, bool]]:
+    """Reduce raw filter input to the filters that actually apply.
 
-    Literal filters use a case-insensitive substring match; filters prefixed with
-    '/' are treated as case-insensitive regex via regexp_matches.
+    Returns ``{column: (pattern, is_regex)}``. Empty values, unknown columns,
+    a bare '/' and invalid regexes are dropped. ``valid_columns`` may be a set
+    or a name-keyed mapping, which is used for lookups as is.
     """
 
-    clauses = []
-    params: list = []
-    valid = set(valid_columns)
+    active: dict[str, tuple[str, bool]] = {}
+    if isinstance(valid_columns, (AbstractSet, Mapping)):
+        valid = valid_columns
+    else:
+        valid = frozenset(valid_columns)
 
     for col, raw in filters.items():
         if col not in valid:
@@ -31,23 +46,48 @@ def build_where_clause(
         if not val:
             continue
 
-        ident = _quote_ident(col)
-
         if val.startswith("/"):
             pattern = val[1:]
-            if not pattern:
-                continue
-            try:
-                re.compile(pattern)
-            except re.error:
+            if not pattern or not _is_valid_regex(pattern):
                 continue
-            clauses.append(f"regexp_matches({ident}, ?, 'i')")
-            params.append(pattern)
+            active[col] = (pattern, True)
         else:
-            clauses.append(f"lower({ident}) LIKE ?")
-            params.append(f"%{val.lower()}%")
+            active[col] = (val, False)
+
+    return active
 
-    if not clauses:
+
+def build_where_clause(
+    filters: dict[str, str], valid_columns: Iterable[str]
+) -> tuple[str, list]:
+    """Build a DuckDB WHERE clause and parameters from filter definitions.
+
+    Literal filters use a case-insensitive substring match; filters prefixed with
+    '/' are treated as case-insensitive regex via regexp_matches.
+    """
+
+    return where_clause_for(parse_filters(filters, valid_columns))
+
+
+def where_clause_for(active: dict[str, tuple[str, bool]]) -> tuple[str, list]:
+    """Build the WHERE clause for filters already reduced by parse_filters."""
+
+    if not active:
         return "", []
 
+    clauses = []
+    params: list = []
+
+    for col, (val, is_regex) in active.items():
+        ident = _quote_ident(col)
+
+        if is_regex:
+            clauses.append(f"regexp_matches({ident}, ?, 'i')")
+            params.append(val)
+        else:
+            # A plain substring search, so '%' and '_' in the filter match
+            # themselves instead of acting as LIKE wildcards.
+            clauses.append(f"contains(lower({ident}), ?)")
+            params.append(val.lower())
+
     return " WHERE " + " AND ".join(clauses), params
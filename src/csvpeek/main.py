@@ -1,7 +1,6 @@
 """Main entry point for csvpeek."""
 
 import argparse
-from pathlib import Path
 
 
 def parse_args(argv: list[str] | None = None):
@@ -30,8 +29,12 @@ def parse_args(argv: list[str] | None = None):
             "Place options before the CSV path, e.g. csvpeek [OPTIONS] <file.csv>"
         )
     csv_path = args.csv_path
-    if not Path(csv_path).exists():
+    try:
+        open(csv_path, "rb").close()
+    except FileNotFoundError:
         parser.error(f"File '{csv_path}' not found.")
+    except OSError as exc:
+        parser.error(f"Cannot read '{csv_path}': {exc.strerror}")
 
     colors = None
     if args.column_colors:
@@ -12,6 +12,8 @@ class Selection:
         self.anchor_col: int | None = None
         self.focus_row: int | None = None
         self.focus_col: int | None = None
+        # (row_start, row_end, col_start, col_end); set whenever active
+        self._bounds: tuple[int, int, int, int] | None = None
 
     def clear(self) -> None:
         self.active = False
@@ -19,6 +21,7 @@ class Selection:
         self.anchor_col = None
         self.focus_row = None
         self.focus_col = None
+        self._bounds = None
 
     def start(self, row: int, col: int) -> None:
         self.active = True
@@ -26,6 +29,7 @@ class Selection:
         self.anchor_col = col
         self.focus_row = row
         self.focus_col = col
+        self._bounds = (row, row, col, col)
 
     def extend(self, row: int, col: int) -> None:
         if not self.active or self.anchor_row is None or self.anchor_col is None:
@@ -33,6 +37,12 @@ class Selection:
             return
         self.focus_row = row
         self.focus_col = col
+        self._bounds = (
+            min(self.anchor_row, row),
+            max(self.anchor_row, row),
+            min(self.anchor_col, col),
+            max(self.anchor_col, col),
+        )
 
     def bounds(self, fallback_row: int, fallback_col: int) -> tuple[int, int, int, int]:
         """Return (row_start, row_end, col_start, col_end).
@@ -40,23 +50,18 @@ class Selection:
         If inactive, falls back to the provided cursor position.
         """
 
-        if not self.active or None in (
-            self.anchor_row,
-            self.anchor_col,
-            self.focus_row,
-            self.focus_col,
-        ):
+        # start/extend keep the bounds current; None means inactive
+        bounds = self._bounds
+        if bounds is None:
             return fallback_row, fallback_row, fallback_col, fallback_col
-
-        row_start = min(self.anchor_row, self.focus_row)
-        row_end = max(self.anchor_row, self.focus_row)
-        col_start = min(self.anchor_col, self.focus_col)
-        col_end = max(self.anchor_col, self.focus_col)
-
-        return row_start, row_end, col_start, col_end
+        return bounds
 
     def dimensions(self, fallback_row: int, fallback_col: int) -> tuple[int, int]:
-        row_start, row_end, col_start, col_end = self.bounds(fallback_row, fallback_col)
+        bounds = self._bounds
+        if bounds is None:
+            # An inactive selection is the single cursor cell
+            return 1, 1
+        row_start, row_end, col_start, col_end = bounds
 
         return row_end - row_start + 1, col_end - col_start + 1
 
@@ -67,54 +72,87 @@ class Selection:
 
         return row_start <= row <= row_end and col_start <= col <= col_end
 
-    def remove(self, new_selection: "Selection"):
+    def remove(
+        self,
+        new_selection: "Selection",
+        within: tuple[int, int, int, int] | None = None,
+    ):
+        """Yield cells in this selection that are not in ``new_selection``.
+
+        ``within`` limits the result to a (row_start, row_end, col_start,
+        col_end) window, such as the cells on screen.
+        """
         if not self.active:
             return
-
-        row_start, row_end, col_start, col_end = self.bounds(0, 0)
-        row_start_new, row_end_new, col_start_new, col_end_new = new_selection.bounds(
-            0, 0
-        )
-
-        for idx_row in range(row_start, row_end + 1):
-            for idx_col in range(col_start, col_end + 1):
-                if (
-                    (idx_row < row_start_new)
-                    or (idx_row > row_end_new)
-                    or (idx_col < col_start_new)
-                    or (idx_col > col_end_new)
-                ):
-                    yield idx_row, idx_col
-
-    def add(self, new_selection: "Selection"):
+        other = new_selection.bounds(0, 0) if new_selection.active else None
+        rect = _clip(self.bounds(0, 0), within)
+        yield from _rect_difference(rect, other)
+
+    def add(
+        self,
+        new_selection: "Selection",
+        within: tuple[int, int, int, int] | None = None,
+    ):
+        """Yield cells in ``new_selection`` that are not in this selection.
+
+        ``within`` limits the result as in :meth:`remove`.
+        """
         if not new_selection.active:
             return
-
-        row_start_new, row_end_new, col_start_new, col_end_new = new_selection.bounds(
-            0, 0
-        )
-
-        self_active = self.active and None not in (
-            self.anchor_row,
-            self.anchor_col,
-            self.focus_row,
-            self.focus_col,
-        )
-        if self_active:
-            row_start, row_end, col_start, col_end = self.bounds(0, 0)
-
-        for idx_row in range(row_start_new, row_end_new + 1):
-            for idx_col in range(col_start_new, col_end_new + 1):
-                if not self_active:
-                    yield idx_row, idx_col
-                    continue
-                if (
-                    idx_row < row_start
-                    or idx_row > row_end
-                    or idx_col < col_start
-                    or idx_col > col_end
-                ):
-                    yield idx_row, idx_col
+        other = self.bounds(0, 0) if self.active else None
+        rect = _clip(new_selection.bounds(0, 0), within)
+        yield from _rect_difference(rect, other)
 
     def __repr__(self):
         return f"({self.anchor_row}, {self.anchor_col}) -> ({self.focus_row}, {self.focus_col})"
+
+
+def _clip(
+    rect: tuple[int, int, int, int], within: tuple[int, int, int, int] | None
+) -> tuple[int, int, int, int]:
+    """Intersect ``rect`` with ``within``; an empty result has start > end."""
+    if within is None:
+        return rect
+    return (
+        max(rect[0], within[0]),
+        min(rect[1], within[1]),
+        max(rect[2], within[2]),
+        min(rect[3], within[3]),
+    )
+
+
+def _rect_difference(
+    rect: tuple[int, int, int, int], other: tuple[int, int, int, int] | None
+):
+    """Yield cells of ``rect`` outside ``other`` in row-major order.
+
+    Both are (row_start, row_end, col_start, col_end). Rows above and below
+    ``other`` are yielded whole; rows beside it are visited only when it
+    leaves a strip on the left or right, so the work is proportional to the
+    number of cells yielded.
+    """
+    row_start, row_end, col_start, col_end = rect
+    full = range(col_start, col_end + 1)
+    if other is None:
+        for idx_row in range(row_start, row_end + 1):
+            for idx_col in full:
+                yield idx_row, idx_col
+        return
+
+    other_row_start, other_row_end, other_col_start, other_col_end = other
+    left = range(col_start, min(col_end, other_col_start - 1) + 1)
+    right = range(max(col_start, other_col_end + 1), col_end + 1)
+
+    for idx_row in range(row_start, min(row_end, other_row_start - 1) + 1):
+        for idx_col in full:
+            yield idx_row, idx_col
+    if left or right:
+        beside = range(max(row_start, other_row_start), min(row_end, other_row_end) + 1)
+        for idx_row in beside:
+            for idx_col in left:
+                yield idx_row, idx_col
+            for idx_col in right:
+                yield idx_row, idx_col
+    for idx_row in range(max(row_start, other_row_end + 1), row_end + 1):
+        for idx_col in full:
+            yield idx_row, idx_col
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from bisect import bisect_right
 from typing import TYPE_CHECKING, Callable
 
 import urwid
@@ -23,6 +24,20 @@ class FlowColumns(urwid.Columns):
     def rows(self, size, focus=False):  # noqa: ANN001, D401
         return 1
 
+    @classmethod
+    def from_cells(
+        cls, cells: list[tuple[int, urwid.Widget]], dividechars: int = 0
+    ) -> FlowColumns:
+        """Build from (width, widget) pairs with a single contents write.
+
+        Columns.__init__ appends cells one at a time and runs a typing
+        Protocol isinstance check on each, which dominated full redraws.
+        """
+        row = cls([], dividechars=dividechars)
+        given = urwid.WHSettings.GIVEN
+        row.contents[:] = [(widget, (given, width, False)) for width, widget in cells]
+        return row
+
 
 class PagingListBox(urwid.ListBox):
     """ListBox that routes page keys to app-level pagination."""
@@ -83,8 +98,11 @@ class FilterDialog(urwid.WidgetWrap):
             self._move_focus(-1)
             return None
         if key in ("enter",):
+            # Blank inputs are no filter at all; leave them out of the dict
             filters = {
-                col: edit.edit_text for col, edit in zip(self.columns, self.edits)
+                col: edit.edit_text
+                for col, edit in zip(self.columns, self.edits)
+                if edit.edit_text.strip()
             }
             self.on_submit(filters)
             return None
@@ -204,53 +222,44 @@ class ConfirmDialog(urwid.WidgetWrap):
 
 
 def current_screen_width(app: "CSVViewerApp") -> int:
-    if app.loop and app.loop.screen:
-        cols, _rows = app.loop.screen.get_cols_rows()
-        return max(cols, 40)
-    return 80
+    return app.current_screen_width()
 
 
 def visible_column_names(app: "CSVViewerApp", max_width: int) -> list[str]:
     if not app.column_names:
         return []
-    names = list(app.column_names)
-    widths = [app.column_widths.get(c, 12) for c in names]
-    divide = 1
-    start = min(app.col_offset, len(names) - 1 if names else 0)
+    names = app.column_names
 
     # Column visibility adjustment now lives on the app
-    app.ensure_cursor_visible(max_width, widths)
-    start = app.col_offset
-
-    chosen: list[str] = []
-    used = 0
-    for idx in range(start, len(names)):
-        w = widths[idx]
-        extra = w if not chosen else w + divide
-        if used + extra > max_width and chosen:
-            break
-        chosen.append(names[idx])
-        used += extra
-    if not chosen and names:
-        chosen.append(names[start])
-    return chosen
+    app.ensure_cursor_visible(max_width)
+    start = min(app.col_offset, len(names) - 1)
+
+    # Columns start..end-1 fit when their widths plus dividers <= max_width;
+    # the first column is always shown, even when it alone is too wide.
+    prefix = app.width_prefix
+    end = bisect_right(prefix, prefix[start] + max_width + 1) - 1
+    return names[start : max(end, start + 1)]
 
 
 def build_header_row(
-    app: "CSVViewerApp", max_width: int | None = None
+    app: "CSVViewerApp",
+    max_width: int | None = None,
+    visible_cols: list[str] | None = None,
 ) -> urwid.Columns:
     if not app.column_names:
         return urwid.Columns([])
-    if max_width is None:
-        max_width = current_screen_width(app)
+    if visible_cols is None:
+        if max_width is None:
+            max_width = current_screen_width(app)
+        visible_cols = visible_column_names(app, max_width)
     cols = []
-    for col in visible_column_names(app, max_width):
+    for col in visible_cols:
         label = col
         if app.sorted_column == col:
             label = f"{col} {'▼' if app.sorted_descending else '▲'}"
         width = app.column_widths.get(col, 12)
         header_text = urwid.Text(_truncate(label, width), wrap="clip")
-        attr = app._column_attr(app.column_names.index(col))
+        attr = app._column_attr(app.column_index[col])
         if attr:
             header_text = urwid.AttrMap(header_text, attr)
         cols.append((width, header_text))
@@ -268,6 +277,7 @@ def build_ui(app: "CSVViewerApp") -> urwid.Widget:
             app.listbox,
         ]
     )
+    app.table_body = body
     footer = urwid.AttrMap(app.status_widget, "status")
     return urwid.Frame(body=body, header=header, footer=footer)
 
@@ -3,8 +3,8 @@
 import pytest
 
 
-@pytest.fixture
-def sample_csv_path(tmp_path):
+@pytest.fixture(scope="session")
+def sample_csv_path(tmp_path_factory):
     """Create a temporary CSV file with sample data for testing."""
     csv_content = """name,age,city,salary,department
 John Doe,28,New York,75000,Engineering
@@ -28,13 +28,13 @@ Oscar Martinez,37,Scranton,68000,Accounting
 Stanley Hudson,55,Scranton,69000,Sales
 Phyllis Vance,50,Scranton,60000,Sales"""
 
-    csv_file = tmp_path / "test_data.csv"
+    csv_file = tmp_path_factory.mktemp("data") / "test_data.csv"
     csv_file.write_text(csv_content)
     return str(csv_file)
 
 
-@pytest.fixture
-def numeric_csv_path(tmp_path):
+@pytest.fixture(scope="session")
+def numeric_csv_path(tmp_path_factory):
     """Create a CSV with numeric data for range filtering tests."""
     csv_content = """id,value,score
 1,100,85.5
@@ -48,13 +48,13 @@ def numeric_csv_path(tmp_path):
 9,280,93.5
 10,320,97.1"""
 
-    csv_file = tmp_path / "numeric_data.csv"
+    csv_file = tmp_path_factory.mktemp("data") / "numeric_data.csv"
     csv_file.write_text(csv_content)
     return str(csv_file)
 
 
-@pytest.fixture
-def special_chars_csv_path(tmp_path):
+@pytest.fixture(scope="session")
+def special_chars_csv_path(tmp_path_factory):
     """Create a CSV with special characters for testing literal matching."""
     csv_content = """email,url,description
 john@example.com,https://example.com,User (admin)
@@ -63,6 +63,6 @@ bob+filter@mail.nl,https://site.nl/page?id=1,Manager - Sales
 alice_w@domain.co.uk,http://domain.co.uk,Analyst * Data
 charlie.brown@site.de,https://site.de/test,Engineer | Backend"""
 
-    csv_file = tmp_path / "special_chars.csv"
+    csv_file = tmp_path_factory.mktemp("data") / "special_chars.csv"
     csv_file.write_text(csv_content)
     return str(csv_file)
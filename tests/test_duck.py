@@ -0,0 +1,73 @@
+"""Tests for the DuckDB backend's paging and caching behaviour."""
+
+from __future__ import annotations
+
+from csvpeek.duck import DuckBackend
+from csvpeek.filters import build_where_clause
+
+
+def make_backend(csv_path: str) -> DuckBackend:
+    db = DuckBackend(csv_path)
+    db.load()
+    return db
+
+
+def test_count_filtered_is_cached_per_filter_set(sample_csv_path: str) -> None:
+    db = make_backend(sample_csv_path)
+    where, params = build_where_clause({"city": "scranton"}, db.column_names)
+
+    assert db.count_filtered(where, params) == 9
+    # A cached count is served without touching the table again
+    db.con.execute("DELETE FROM data")
+    assert db.count_filtered(where, params) == 9
+
+
+def test_count_cache_is_bounded(sample_csv_path: str) -> None:
+    db = make_backend(sample_csv_path)
+    db.COUNT_CACHE_SIZE = 2
+    for name in ("a", "b", "c"):
+        where, params = build_where_clause({"name": name}, db.column_names)
+        db.count_filtered(where, params)
+
+    assert len(db._count_cache) == 2
+
+
+def test_count_and_page_share_one_materialization(sample_csv_path: str) -> None:
+    db = make_backend(sample_csv_path)
+    where, params = build_where_clause({"department": "sales"}, db.column_names)
+
+    assert db.count_filtered(where, params, "name", False) == 9
+    result_key = db._result_key
+    rows = db.fetch_rows(where, params, "name", False, 3, 0)
+
+    assert db._result_key == result_key
+    assert [row[0] for row in rows] == ["Bob Johnson", "Diana Prince", "Dwight Schrute"]
+
+
+def test_recent_pages_are_reused(sample_csv_path: str) -> None:
+    db = make_backend(sample_csv_path)
+    db.PAGE_CACHE_SIZE = 2
+    first = db.fetch_rows("", [], None, False, 5, 0)
+    second = db.fetch_rows("", [], None, False, 5, 5)
+
+    db.con.execute("DELETE FROM data")
+    assert db.fetch_rows("", [], None, False, 5, 0) == first
+    assert db.fetch_rows("", [], None, False, 5, 5) == second
+    # The least recently used page was evicted and is fetched again
+    db.fetch_rows("", [], None, False, 5, 10)
+    assert db.fetch_rows("", [], None, False, 5, 0) == []
+
+
+def test_fetch_rows_reads_only_requested_columns(sample_csv_path: str) -> None:
+    db = make_backend(sample_csv_path)
+    full = db.fetch_rows("", [], None, False, 2, 0)
+    projected = db.fetch_rows("", [], None, False, 2, 0, columns=["name", "city"])
+
+    assert projected == [(row[0], "", row[2], "", "") for row in full]
+
+
+def test_load_reads_row_count_and_columns(sample_csv_path: str) -> None:
+    db = make_backend(sample_csv_path)
+
+    assert db.column_names == ["name", "age", "city", "salary", "department"]
+    assert db.total_rows == db.con.execute("SELECT count(*) FROM data").fetchone()[0]
@@ -1,5 +1,7 @@
 """Test that empty cells are properly highlighted when selected."""
 
+import re
+
 from csvpeek.csvpeek import CSVViewerApp
 
 
@@ -67,6 +69,43 @@ def test_cell_with_filter_match():
     assert any("filter" in str(item) for item in markup)
 
 
+def test_repeated_literal_matches_do_not_overlap():
+    """Overlapping occurrences are highlighted once, without repeating text."""
+    app = CSVViewerApp.__new__(CSVViewerApp)
+
+    markup = app._cell_markup(
+        "aaa", width=10, filter_info=("AA", False), is_selected=False
+    )
+    assert markup == [("filter", "aa"), "a"]
+
+
+def test_cell_with_compiled_regex_filter():
+    """Precompiled regex filters highlight the same spans as pattern strings."""
+    app = CSVViewerApp.__new__(CSVViewerApp)
+    compiled = re.compile("t.st", re.IGNORECASE)
+
+    markup = app._cell_markup(
+        "TEST data", width=15, filter_info=(compiled, True), is_selected=False
+    )
+    assert markup == [("filter", "TEST"), " data"]
+    assert markup == app._cell_markup(
+        "TEST data", width=15, filter_info=("t.st", True), is_selected=False
+    )
+
+
+def test_repeated_cell_markup_is_not_shared():
+    """Memoized markup hands each caller its own list."""
+    app = CSVViewerApp.__new__(CSVViewerApp)
+    first = app._cell_markup(
+        "Scranton", width=10, filter_info=("ran", False), is_selected=False
+    )
+    first.append("mutated")
+    second = app._cell_markup(
+        "Scranton", width=10, filter_info=("ran", False), is_selected=False
+    )
+    assert second == ["Sc", ("filter", "ran"), "ton"]
+
+
 def test_empty_cell_copy_preserves_emptiness():
     """Test that copying empty cells doesn't include the display space."""
     import csv
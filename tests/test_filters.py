@@ -2,132 +2,165 @@
 
 from __future__ import annotations
 
+import re
+
 import duckdb
+import pytest
 
-from csvpeek.filters import build_where_clause
+from csvpeek.filters import build_where_clause, parse_filters, where_clause_for
 
 
-def _load_table(con: duckdb.DuckDBPyConnection, csv_path: str) -> tuple[list[str], int]:
-    con.execute("DROP TABLE IF EXISTS data")
+def _load_table(con: duckdb.DuckDBPyConnection, table: str, csv_path: str) -> None:
     con.execute(
-        "CREATE TABLE data AS SELECT * FROM read_csv_auto(?, ALL_VARCHAR=TRUE)",
+        f"CREATE TABLE {table} AS SELECT * FROM read_csv_auto(?, ALL_VARCHAR=TRUE)",
         [csv_path],
     )
-    columns = [row[1] for row in con.execute("PRAGMA table_info('data')").fetchall()]
-    total_rows = con.execute("SELECT count(*) FROM data").fetchone()[0]
-    return columns, total_rows
+
+
+@pytest.fixture(scope="module")
+def con(sample_csv_path, special_chars_csv_path):
+    """One connection for the module, with each fixture CSV loaded once."""
+    with duckdb.connect() as con:
+        _load_table(con, "sample", sample_csv_path)
+        _load_table(con, "special", special_chars_csv_path)
+        yield con
+
+
+@pytest.fixture(scope="module")
+def sample_total_rows(con):
+    return con.execute("SELECT count(*) FROM sample").fetchone()[0]
 
 
 def _filter_rows(
     con: duckdb.DuckDBPyConnection,
-    csv_path: str,
+    table: str,
     filters: dict[str, str],
     select: str = "*",
 ):
-    columns, total_rows = _load_table(con, csv_path)
+    info = con.execute(f"PRAGMA table_info('{table}')").fetchall()
+    columns = [row[1] for row in info]
     where_clause, params = build_where_clause(filters, columns)
-    rows = con.execute(f"SELECT {select} FROM data{where_clause}", params).fetchall()
-    return rows, total_rows
+    rows = con.execute(f"SELECT {select} FROM {table}{where_clause}", params).fetchall()
+    return rows
 
 
 class TestStringFiltering:
     """Case-insensitive substring filtering."""
 
-    def test_basic_string_filter(self, sample_csv_path):
-        with duckdb.connect() as con:
-            rows, _ = _filter_rows(
-                con, sample_csv_path, {"city": "New York"}, select="city"
-            )
+    def test_basic_string_filter(self, con):
+        rows = _filter_rows(con, "sample", {"city": "New York"}, select="city")
         assert len(rows) == 2
         assert all("new york" in city[0].lower() for city in rows)
 
-    def test_case_insensitive_filter(self, sample_csv_path):
-        with duckdb.connect() as con:
-            rows, _ = _filter_rows(con, sample_csv_path, {"city": "scranton"})
+    @pytest.mark.parametrize("query", ["scranton", "SCRANTON", "Scranton"])
+    def test_case_insensitive_filter(self, con, query):
+        rows = _filter_rows(con, "sample", {"city": query})
         assert len(rows) == 9
 
-    def test_whitespace_handling(self, sample_csv_path):
-        with duckdb.connect() as con:
-            rows, _ = _filter_rows(con, sample_csv_path, {"city": "  Scranton  "})
+    def test_whitespace_handling(self, con):
+        rows = _filter_rows(con, "sample", {"city": "  Scranton  "})
         assert len(rows) == 9
 
 
 class TestMultiColumnFiltering:
     """Filters combine with AND semantics."""
 
-    def test_multiple_filters_and_logic(self, sample_csv_path):
-        with duckdb.connect() as con:
-            rows, _ = _filter_rows(
-                con,
-                sample_csv_path,
-                {"department": "Sales", "city": "Scranton"},
-                select="department, city",
-            )
+    def test_multiple_filters_and_logic(self, con):
+        rows = _filter_rows(
+            con,
+            "sample",
+            {"department": "Sales", "city": "Scranton"},
+            select="department, city",
+        )
         assert len(rows) == 6
         assert all(
             row[0].lower() == "sales" and row[1].lower() == "scranton" for row in rows
         )
 
-    def test_empty_filter_is_ignored(self, sample_csv_path):
-        with duckdb.connect() as con:
-            rows, total = _filter_rows(con, sample_csv_path, {"city": "  "})
-        assert len(rows) == total
+    def test_empty_filter_is_ignored(self, con, sample_total_rows):
+        rows = _filter_rows(con, "sample", {"city": "  "})
+        assert len(rows) == sample_total_rows
 
-    def test_nonexistent_column_is_ignored(self, sample_csv_path):
-        with duckdb.connect() as con:
-            rows, total = _filter_rows(
-                con, sample_csv_path, {"does_not_exist": "value"}
-            )
-        assert len(rows) == total
+    def test_nonexistent_column_is_ignored(self, con, sample_total_rows):
+        rows = _filter_rows(con, "sample", {"does_not_exist": "value"})
+        assert len(rows) == sample_total_rows
 
 
 class TestRegexFiltering:
     """Regex filters use DuckDB regexp_matches with 'i' flag."""
 
-    def test_basic_regex_filter(self, sample_csv_path):
-        with duckdb.connect() as con:
-            rows, _ = _filter_rows(con, sample_csv_path, {"name": "/^j"}, select="name")
-        assert len(rows) == 3
-        assert all(name[0].lower().startswith("j") for name in rows)
-
-    def test_regex_alternation(self, sample_csv_path):
-        with duckdb.connect() as con:
-            rows, _ = _filter_rows(
-                con,
-                sample_csv_path,
-                {"department": "/Sales|Engineering"},
-                select="department",
-            )
-        assert len(rows) == 14
-        assert all(
-            "sales" in dept[0].lower() or "engineering" in dept[0].lower()
-            for dept in rows
-        )
+    @pytest.mark.parametrize(
+        "column,pattern,expected",
+        [
+            ("name", "^j", 3),
+            ("department", "Sales|Engineering", 14),
+            ("city", "^s(an|ea)", 2),
+        ],
+    )
+    def test_regex_filter(self, con, column, pattern, expected):
+        rows = _filter_rows(con, "sample", {column: f"/{pattern}"}, select=column)
+        assert len(rows) == expected
+        assert all(re.search(pattern, value, re.IGNORECASE) for (value,) in rows)
 
-    def test_invalid_regex_is_skipped(self, sample_csv_path):
-        with duckdb.connect() as con:
-            rows, total = _filter_rows(con, sample_csv_path, {"name": "/["})
-        assert len(rows) == total
+    def test_invalid_regex_is_skipped(self, con, sample_total_rows):
+        rows = _filter_rows(con, "sample", {"name": "/["})
+        assert len(rows) == sample_total_rows
 
 
 class TestSpecialCharacters:
     """Literal substring matching handles punctuation characters."""
 
-    def test_literal_dot_in_filter(self, special_chars_csv_path):
-        with duckdb.connect() as con:
-            rows, _ = _filter_rows(
-                con, special_chars_csv_path, {"url": ".nl"}, select="url"
-            )
+    def test_literal_dot_in_filter(self, con):
+        rows = _filter_rows(con, "special", {"url": ".nl"}, select="url")
         assert len(rows) == 1
         assert ".nl" in rows[0][0]
 
-    def test_plus_and_at_symbols(self, special_chars_csv_path):
-        with duckdb.connect() as con:
-            plus_rows, _ = _filter_rows(
-                con, special_chars_csv_path, {"email": "+"}, select="email"
-            )
-            at_rows, _ = _filter_rows(
-                con, special_chars_csv_path, {"email": "@"}, select="email"
-            )
-        assert len(plus_rows) == 1
-        assert len(at_rows) == 5
+    @pytest.mark.parametrize("query,expected", [("+", 1), ("@", 5)])
+    def test_plus_and_at_symbols(self, con, query, expected):
+        rows = _filter_rows(con, "special", {"email": query}, select="email")
+        assert len(rows) == expected
+
+    def test_like_wildcards_match_literally(self, con):
+        underscore_rows = _filter_rows(con, "special", {"email": "_"}, select="email")
+        percent_rows = _filter_rows(con, "special", {"email": "%"}, select="email")
+        assert underscore_rows == [("alice_w@domain.co.uk",)]
+        assert percent_rows == []
+
+
+class TestParseFilters:
+    """Only filters that reach the WHERE clause are reported as active."""
+
+    def test_drops_inactive_filters(self):
+        active = parse_filters(
+            {"name": "/[", "city": "/", "age": "  ", "missing": "x", "dept": " Sales "},
+            ["name", "city", "age", "dept"],
+        )
+        assert active == {"dept": ("Sales", False)}
+
+    def test_regex_filter_strips_prefix(self):
+        assert parse_filters({"name": "/^j"}, ["name"]) == {"name": ("^j", True)}
+
+    def test_where_clause_from_parsed_filters(self):
+        filters = {"name": "/^j", "city": "York", "age": " "}
+        active = parse_filters(filters, ["name", "city", "age"])
+        assert where_clause_for(active) == build_where_clause(
+            filters, ["name", "city", "age"]
+        )
+        assert where_clause_for({}) == ("", [])
+
+    def test_accepts_column_index_mapping(self):
+        index = {"name": 0, "city": 1}
+        active = parse_filters({"city": "york", "dept": "x"}, index)
+        assert active == {"city": ("york", False)}
+
+
+def test_filter_dialog_submits_only_filled_inputs():
+    from csvpeek.ui import FilterDialog
+
+    submitted = []
+    dialog = FilterDialog(
+        ["name", "city", "age"], {"city": "york"}, submitted.append, lambda: None
+    )
+    dialog.edits[2].set_edit_text("  ")
+    dialog.keypress((40, 10), "enter")
+    assert submitted == [{"city": "york"}]
@@ -1,5 +1,6 @@
 from csvpeek.csvpeek import CSVViewerApp
 from csvpeek.selection_utils import Selection
+from csvpeek.ui import visible_column_names
 
 
 def make_app(csv_path: str) -> CSVViewerApp:
@@ -8,6 +9,19 @@ def make_app(csv_path: str) -> CSVViewerApp:
     return app
 
 
+class FakeLoop:
+    """Stand-in for urwid.MainLoop that collects alarms instead of running them."""
+
+    screen = None
+    widget = None
+
+    def __init__(self) -> None:
+        self.alarms: list = []
+
+    def set_alarm_in(self, _sec: float, callback) -> None:
+        self.alarms.append(callback)
+
+
 def test_selection_bounds_and_dimensions() -> None:
     sel = Selection()
     sel.start(5, 2)
@@ -28,6 +42,16 @@ def test_selection_fallback_when_inactive() -> None:
     assert sel.bounds(2, 1) == (2, 2, 1, 1)
 
 
+def test_selection_bounds_follow_extend_and_clear() -> None:
+    sel = Selection()
+    sel.start(5, 4)
+    sel.extend(7, 6)
+    sel.extend(3, 1)
+    assert sel.bounds(0, 0) == (3, 5, 1, 4)
+    sel.clear()
+    assert sel.bounds(2, 1) == (2, 2, 1, 1)
+
+
 def test_create_selected_dataframe_uses_absolute_rows(sample_csv_path: str) -> None:
     app = make_app(sample_csv_path)
     # Select rows 2-4 (0-indexed) and columns 0-1
@@ -43,6 +67,23 @@ def test_create_selected_dataframe_uses_absolute_rows(sample_csv_path: str) -> N
     ]
 
 
+def test_copying_a_selection_leaves_the_page_cache_alone(
+    sample_csv_path: str, monkeypatch
+) -> None:
+    copied: list[str] = []
+    monkeypatch.setattr("csvpeek.csvpeek.pyperclip.copy", copied.append)
+    app = make_app(sample_csv_path)
+    app._refresh_rows()
+    pages = list(app.db._page_cache.items())
+    app.selection.start(2, 0)
+    app.selection.extend(4, 1)
+
+    app.copy_selection()
+
+    assert "Charlie Brown" in copied[0]
+    assert list(app.db._page_cache.items()) == pages
+
+
 def test_create_selected_dataframe_fallbacks_to_cursor(sample_csv_path: str) -> None:
     app = make_app(sample_csv_path)
     app.cursor_row = 1
@@ -233,3 +274,256 @@ def test_scroll() -> None:
     assert set(sel.remove(sel2)) == set()
 
     assert set(sel.add(sel2)) == {(2, 0), (2, 1)}
+
+
+def test_remove_when_new_inactive_removes_all_prev() -> None:
+    sel = Selection()
+    sel.start(0, 0)
+    sel.extend(1, 1)
+
+    assert set(sel.remove(Selection())) == {(0, 0), (0, 1), (1, 0), (1, 1)}
+
+
+def test_clear_selection_repaints_without_full_redraw(sample_csv_path: str) -> None:
+    app = make_app(sample_csv_path)
+    app._refresh_rows()
+    app.selection.start(0, 0)
+    app.selection.extend(1, 1)
+    app.page_redraw_needed = True
+    app._refresh_rows()
+    rows_before = list(app.table_walker)
+
+    app.cursor_row = 1
+    app.cursor_col = 1
+    app.clear_selection_and_update()
+
+    # Row widgets are patched in place rather than rebuilt
+    assert list(app.table_walker) == rows_before
+    assert app.table_walker[0].contents[0][0].get_text() == ("John Doe", [])
+    _text, attrs = app.table_walker[1].contents[1][0].get_text()
+    assert attrs == [("cell_selected", 2)]
+
+
+def test_clearing_a_huge_selection_repaints_only_the_page(
+    sample_csv_path: str,
+) -> None:
+    app = make_app(sample_csv_path)
+    app._refresh_rows()
+    app.selection.start(0, 0)
+    app.selection.extend(10**9, len(app.column_names) - 1)
+    app._refresh_rows()
+
+    # Walking the cleared area cell by cell would never finish
+    app.clear_selection_and_update()
+
+    _text, attrs = app.table_walker[1].contents[1][0].get_text()
+    assert attrs == []
+
+
+def test_selection_diff_within_a_window() -> None:
+    old = Selection()
+    old.start(0, 0)
+    old.extend(10**9, 10**9)
+
+    window = (5, 6, 2, 3)
+    assert list(old.remove(Selection(), window)) == [(5, 2), (5, 3), (6, 2), (6, 3)]
+    assert list(Selection().add(old, (10**9 + 1, 10**9 + 5, 0, 3))) == []
+
+
+def test_scroll_by_one_row_matches_full_redraw(sample_csv_path: str) -> None:
+    def rendered(app: CSVViewerApp) -> list:
+        return [
+            [cell.get_text() for cell, _opts in row.contents]
+            for row in app.table_walker
+        ]
+
+    app = make_app(sample_csv_path)
+    app.PAGE_SIZE = 5
+    app._refresh_rows()
+    app.cursor_row = app.PAGE_SIZE - 1
+    app.move_cursor("down")
+    app.move_cursor("shift down")
+    assert app.row_offset == 2
+    # Walk the selection back up past the top of the page
+    for _ in range(app.PAGE_SIZE):
+        app.move_cursor("shift up")
+
+    assert app.row_offset == 1
+    scrolled = rendered(app)
+    scrolled_rows = list(app.cached_rows)
+
+    app.page_redraw_needed = True
+    app.cached_rows = []
+    app._refresh_rows()
+    assert app.cached_rows == scrolled_rows
+    assert rendered(app) == scrolled
+
+
+def test_remove_and_add_match_cell_set_difference() -> None:
+    def cells(sel: Selection) -> set[tuple[int, int]]:
+        row_start, row_end, col_start, col_end = sel.bounds(0, 0)
+        return {
+            (row, col)
+            for row in range(row_start, row_end + 1)
+            for col in range(col_start, col_end + 1)
+        }
+
+    corners = [(0, 0), (2, 3), (5, 1), (1, 6), (4, 4)]
+    for anchor in corners:
+        for focus in corners:
+            for new_anchor in corners:
+                for new_focus in corners:
+                    old = Selection()
+                    old.start(*anchor)
+                    old.extend(*focus)
+                    new = Selection()
+                    new.start(*new_anchor)
+                    new.extend(*new_focus)
+
+                    assert set(old.remove(new)) == cells(old) - cells(new)
+                    assert list(old.remove(new)) == sorted(cells(old) - cells(new))
+                    assert list(old.add(new)) == sorted(cells(new) - cells(old))
+
+
+def test_growing_a_tall_selection_skips_the_rows_it_already_covers() -> None:
+    old = Selection()
+    old.start(0, 0)
+    old.extend(10**9, 3)
+    new = Selection()
+    new.start(0, 0)
+    new.extend(10**9 + 1, 3)
+
+    # Walking every overlapping row would never finish
+    assert list(old.add(new)) == [(10**9 + 1, col) for col in range(4)]
+    assert list(new.remove(old)) == [(10**9 + 1, col) for col in range(4)]
+
+
+def test_cursor_moves_coalesce_into_one_refresh(sample_csv_path: str) -> None:
+    app = make_app(sample_csv_path)
+    app._refresh_rows()
+    app.loop = FakeLoop()
+
+    app.move_cursor("shift right")
+    app.move_cursor("shift down")
+    app.move_cursor("shift down")
+    assert len(app.loop.alarms) == 1
+    # Nothing is painted until the burst has been handled
+    assert app.table_walker[2].contents[1][0].get_text()[1] == []
+
+    app.loop.alarms.pop()(app.loop, None)
+    assert (app.cursor_row, app.cursor_col) == (2, 1)
+    for row in range(3):
+        for col in range(2):
+            _text, attrs = app.table_walker[row].contents[col][0].get_text()
+            assert attrs and attrs[0][0] == "cell_selected"
+    _text, attrs = app.table_walker[3].contents[0][0].get_text()
+    assert attrs == []
+
+
+def test_horizontal_scroll_keeps_cursor_column_visible(sample_csv_path: str) -> None:
+    app = make_app(sample_csv_path)
+    widths = [app.column_widths[name] for name in app.column_names]
+    # Room for exactly two columns and the divider between them
+    max_width = widths[2] + 1 + widths[3]
+
+    app.cursor_col = 3
+    visible = visible_column_names(app, max_width)
+    assert app.col_offset == 2
+    assert visible == ["city", "salary"]
+
+    app.cursor_col = 0
+    assert visible_column_names(app, max_width)[0] == "name"
+    assert app.col_offset == 0
+
+
+def test_header_is_rebuilt_only_when_labels_change(sample_csv_path: str) -> None:
+    app = make_app(sample_csv_path)
+    app.PAGE_SIZE = 5
+    app._refresh_rows()
+    header = app.table_header
+
+    app.next_page()
+    assert app.table_header is header
+
+    app.sort_current_column()
+    assert app.table_header is not header
+    assert app.table_header.contents[0][0].get_text()[0] == "name ▲"
+
+
+def test_screen_size_is_read_once_until_resize(sample_csv_path: str) -> None:
+    class FakeScreen:
+        calls = 0
+        size = (120, 30)
+
+        def get_cols_rows(self) -> tuple[int, int]:
+            self.calls += 1
+            return self.size
+
+    app = make_app(sample_csv_path)
+    app.loop = FakeLoop()
+    app.loop.screen = FakeScreen()
+    app._refresh_rows()
+    app.move_cursor("right")
+    app.loop.alarms.pop()()
+    assert app.loop.screen.calls == 1
+    assert app.available_body_rows() == 26
+
+    app.loop.screen.size = (120, 20)
+    app._filter_input(["window resize"], [])
+    assert app.available_body_rows() == 16
+    assert app.loop.screen.calls == 2
+
+
+def test_copy_right_after_cursor_moves_uses_the_new_cell(tmp_path, monkeypatch):
+    csv_path = tmp_path / "wide.csv"
+    header = ",".join(f"c{col}" for col in range(30))
+    rows = [",".join(f"r{row}c{col}" for col in range(30)) for row in range(12)]
+    csv_path.write_text("\n".join([header, *rows]))
+    copied: list[str] = []
+    monkeypatch.setattr("csvpeek.csvpeek.pyperclip.copy", copied.append)
+
+    app = make_app(str(csv_path))
+    app.PAGE_SIZE = 5
+    app._refresh_rows()
+    app.loop = FakeLoop()
+    # Same input burst: the refresh alarm has not run before "c" arrives
+    for _ in range(15):
+        app.handle_input("right")
+    app.handle_input("c")
+    for _ in range(6):
+        app.handle_input("down")
+    app.handle_input("c")
+
+    assert copied == ["r0c15", "r6c15"]
+
+
+def test_one_row_scrolls_do_not_evict_cached_pages(sample_csv_path: str) -> None:
+    app = make_app(sample_csv_path)
+    app.PAGE_SIZE = 5
+    app.loop = FakeLoop()
+    app._refresh_rows()
+    app.next_page()
+    app.prev_page()
+    pages = list(app.db._page_cache)
+
+    app.cursor_row = 4
+    for _ in range(4):
+        app.move_cursor("down")
+        app._flush_refresh()
+
+    assert app.row_offset == 4
+    assert list(app.db._page_cache) == pages
+
+
+def test_single_cell_value_reads_columns_outside_the_page(tmp_path) -> None:
+    csv_path = tmp_path / "wide.csv"
+    header = ",".join(f"c{col}" for col in range(30))
+    rows = [",".join(f"r{row}c{col}" for col in range(30)) for row in range(3)]
+    csv_path.write_text("\n".join([header, *rows]))
+
+    app = make_app(str(csv_path))
+    app._refresh_rows()
+    # Not drawn yet: cached_rows holds '' placeholders for this column
+    app.cursor_row, app.cursor_col = 2, 20
+    assert app.cached_rows[2][20] == ""
+    assert app.get_single_cell_value() == "r2c20"